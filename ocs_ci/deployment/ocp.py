@@ -2,9 +2,11 @@
 This module provides base class for OCP deployment.
 """
 
+import functools
 import logging
 import os
 import json
+import tempfile
 
 import pytest
 import yaml
@@ -15,7 +17,7 @@ from ocs_ci.ocs.openshift_ops import OCP
 from ocs_ci.utility import utils, templating, system, version
 from ocs_ci.utility.deployment import get_ocp_release_image
 from ocs_ci.deployment.disconnected import mirror_ocp_release_images
-from ocs_ci.utility.utils import create_directory_path, exec_cmd
+from ocs_ci.utility.utils import exec_cmd
 
 logger = logging.getLogger(__name__)
 
@@ -29,30 +31,56 @@ def download_pull_secret():
     """
     pull_secret_path = os.path.join(constants.DATA_DIR, "pull-secret")
     # create DATA_DIR if it doesn't exist
-    if not os.path.exists(constants.DATA_DIR):
-        create_directory_path(constants.DATA_DIR)
+    os.makedirs(constants.DATA_DIR, exist_ok=True)
     if not os.path.isfile(pull_secret_path):
         logger.info(f"Extracting pull-secret and placing it under {pull_secret_path}")
-        exec_cmd(
-            f"oc get secret pull-secret -n {constants.OPENSHIFT_CONFIG_NAMESPACE} -ojson | "
-            f"jq -r '.data.\".dockerconfigjson\"|@base64d' > {pull_secret_path}",
-            shell=True,
-        )
+        # oc extract decodes the secret key itself, so neither shell nor jq
+        # is needed and the secret content doesn't go through the command
+        # output log. It is extracted to a temporary directory first, so an
+        # interrupted write never leaves a truncated pull secret behind.
+        with tempfile.TemporaryDirectory(dir=constants.DATA_DIR) as tmp_dir:
+            exec_cmd(
+                f"oc extract secret/pull-secret "
+                f"-n {constants.OPENSHIFT_CONFIG_NAMESPACE} "
+                f"--keys=.dockerconfigjson --to={tmp_dir} --confirm"
+            )
+            os.replace(os.path.join(tmp_dir, ".dockerconfigjson"), pull_secret_path)
     else:
         logger.info(f"Pull secret already exists at {pull_secret_path}")
     return pull_secret_path
 
 
+@functools.lru_cache(maxsize=1)
+def _load_pull_secret(pull_secret_path, mtime):
+    """
+    Load pull secret file, cached for the given path and modification time
+
+    Args:
+        pull_secret_path (str): path to the pull secret file
+        mtime (float): modification time of the file, part of the cache key
+            so the cache is invalidated when the file is rewritten
+
+    Returns:
+        str: content of pull secret as compact single line JSON
+    """
+    with open(pull_secret_path, "r") as f:
+        # Parse, then unparse, the JSON file.
+        # We do this for two reasons: to ensure it is well-formatted, and
+        # also to ensure it ends up as a single line.
+        return json.dumps(json.loads(f.read()), separators=(",", ":"))
+
+
 class OCPDeployment:
     def __init__(self):
         """
         Constructor for OCPDeployment class
         """
+        env_data = config.ENV_DATA
         self.pull_secret = {}
         self.metadata = {}
-        self.deployment_platform = config.ENV_DATA["platform"].lower()
-        self.sno = config.ENV_DATA["sno"]
-        self.deployment_type = config.ENV_DATA["deployment_type"].lower()
+        self.deployment_platform = env_data["platform"].lower()
+        self.sno = env_data["sno"]
+        self.deployment_type = env_data["deployment_type"].lower()
         if not hasattr(self, "flexy_deployment"):
             self.flexy_deployment = False
         ibmcloud_managed_deployment = (
@@ -60,17 +88,17 @@ class OCPDeployment:
             and self.deployment_type == "managed"
         )
         # deployment via assisted installer
-        ai_deployment = config.ENV_DATA["deployment_type"] == "ai"
+        ai_deployment = env_data["deployment_type"] == "ai"
         if (
             not self.flexy_deployment
             and not ibmcloud_managed_deployment
             and not ai_deployment
         ):
             self.installer = self.download_installer()
-        self.cluster_path = config.ENV_DATA["cluster_path"]
-        self.cluster_name = config.ENV_DATA["cluster_name"]
+        self.cluster_path = env_data["cluster_path"]
+        self.cluster_name = env_data["cluster_name"]
         if (
-            config.ENV_DATA.get("fips")
+            env_data.get("fips")
             and version.get_semantic_ocp_version_from_config() >= version.VERSION_4_16
         ):
             self.installer_filename = "openshift-install-fips"
@@ -100,11 +128,7 @@ class OCPDeployment:
             str: content of pull secret
         """
         pull_secret_path = os.path.join(constants.DATA_DIR, "pull-secret")
-        with open(pull_secret_path, "r") as f:
-            # Parse, then unparse, the JSON file.
-            # We do this for two reasons: to ensure it is well-formatted, and
-            # also to ensure it ends up as a single line.
-            return json.dumps(json.loads(f.read()))
+        return _load_pull_secret(pull_secret_path, os.stat(pull_secret_path).st_mtime)
 
     def get_ssh_key(self):
         """
@@ -118,8 +142,8 @@ class OCPDeployment:
         if not os.path.isfile(ssh_key):
             return ""
         with open(ssh_key, "r") as fs:
-            lines = fs.readlines()
-            return lines[0].rstrip("\n") if lines else ""
+            first_line = fs.readline()
+            return first_line.rstrip("\n") if first_line else ""
 
     def deploy_prereq(self):
         """
@@ -189,12 +213,14 @@ class OCPDeployment:
         # so we don't leak sensitive data.
         logger.info(f"Install config: \n{install_config_str}")
         # Parse the rendered YAML so that we can manipulate the object directly
-        install_config_obj = yaml.safe_load(install_config_str)
+        install_config_obj = yaml.load(install_config_str, Loader=templating.SafeLoader)
         install_config_obj["pullSecret"] = self.get_pull_secret()
         ssh_key = self.get_ssh_key()
         if ssh_key:
             install_config_obj["sshKey"] = ssh_key
-        install_config_str = yaml.safe_dump(install_config_obj)
+        install_config_str = yaml.dump(
+            install_config_obj, Dumper=templating.SafeDumper, default_flow_style=False
+        )
         install_config = os.path.join(self.cluster_path, "install-config.yaml")
         with open(install_config, "w") as f:
             f.write(install_config_str)
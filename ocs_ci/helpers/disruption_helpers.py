@@ -159,6 +159,32 @@ class Disruptions:
             timeout=300,
         )
 
+    def delete_all(self):
+        """
+        Delete all the pods of the resource in a single oc call and wait for
+        them to be running again
+
+        """
+        namespace = (
+            self.resource_obj[0].namespace or config.ENV_DATA["cluster_namespace"]
+        )
+        pod_ocp = ocp.OCP(kind=constants.POD, namespace=namespace)
+        if self.cluster_kubeconfig:
+            # Setting 'cluster_kubeconfig' attribute to use as the value of the
+            # parameter '--kubeconfig' in the 'oc' commands.
+            pod_ocp.cluster_kubeconfig = self.cluster_kubeconfig
+        pod_ocp.delete(
+            resource_name=" ".join(pod_obj.name for pod_obj in self.resource_obj),
+            wait=False,
+            force=True,
+        )
+        assert pod_ocp.wait_for_resource(
+            condition="Running",
+            selector=self.selector,
+            resource_count=self.resource_count,
+            timeout=300,
+        )
+
     @retry(AssertionError, tries=5, delay=3, backoff=1)
     def select_daemon(self, node_name=None):
         """
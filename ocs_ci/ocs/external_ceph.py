@@ -1,6 +1,11 @@
 import datetime
+import io
 import json
 import logging
+import socket
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from select import select
 from time import sleep
 
@@ -22,13 +27,15 @@ class Ceph(object):
         """
         self.name = name
         self.node_list = node_list
+        self._role_index = None
+        self._objects_by_role = None
+        self._indexed_nodes = None
+        for node in self.node_list or []:
+            node.cluster = self
 
     def __eq__(self, ceph_cluster):
         if hasattr(ceph_cluster, "node_list"):
-            if all(atomic_node in ceph_cluster for atomic_node in self.node_list):
-                return True
-            else:
-                return False
+            return set(self.node_list) == set(ceph_cluster.node_list)
         else:
             return False
 
@@ -43,13 +50,92 @@ class Ceph(object):
 
     def __setitem__(self, key, value):
         self.node_list[key] = value
+        value.cluster = self
+        self.invalidate_role_index()
 
     def __delitem__(self, key):
         del self.node_list[key]
+        self.invalidate_role_index()
 
     def __iter__(self):
         return iter(self.node_list)
 
+    def invalidate_role_index(self):
+        """
+        Drop the role to nodes and role to ceph objects indexes, they are
+        rebuilt on the next role lookup
+
+        """
+        self._role_index = None
+        self._objects_by_role = None
+
+    def _build_role_index(self):
+        """
+        Build indexes mapping each role to the nodes and to the ceph objects
+        having that role
+
+        """
+        role_index = {}
+        objects_by_role = {}
+        for node in self.node_list:
+            # Nodes added to node_list directly have to report their role
+            # changes to this cluster as well
+            node.cluster = self
+            for role in node._get_roles():
+                role_index.setdefault(role, []).append(node)
+            for ceph_object in node.ceph_object_list:
+                objects_by_role.setdefault(ceph_object.role, []).append(ceph_object)
+        self._role_index = role_index
+        self._objects_by_role = objects_by_role
+        self._indexed_nodes = self._get_node_ids()
+
+    def _get_node_ids(self):
+        """
+        Get identities of the cluster nodes, node_list is public and may be
+        changed without going through the cluster
+
+        Returns:
+            tuple: id of each node in node_list
+
+        """
+        return tuple(id(node) for node in self.node_list or [])
+
+    def _is_role_index_valid(self):
+        """
+        Whether the role indexes were built and node_list is still the same
+
+        Returns:
+            bool: True if the indexes can be used
+
+        """
+        return (
+            self._role_index is not None and self._indexed_nodes == self._get_node_ids()
+        )
+
+    def _get_role_index(self):
+        """
+        Get index mapping each role to the list of nodes having that role
+
+        Returns:
+            dict: role (str) to list of CephNode
+
+        """
+        if not self._is_role_index_valid():
+            self._build_role_index()
+        return self._role_index
+
+    def _get_objects_by_role(self):
+        """
+        Get index mapping each role to the list of ceph objects of that role
+
+        Returns:
+            dict: role (str) to list of CephObject
+
+        """
+        if not self._is_role_index_valid():
+            self._build_role_index()
+        return self._objects_by_role
+
     def get_nodes(self, role=None, ignore=None):
         """
         Get node(s) by role. Return all nodes if role is not defined
@@ -62,13 +148,35 @@ class Ceph(object):
             list: nodes
 
         """
-        if role:
+        if isinstance(role, str):
+            return list(self._get_role_index().get(role, ()))
+        elif role:
             return [node for node in self.node_list if node.role == role]
         elif ignore:
             return [node for node in self.node_list if node.role != ignore]
         else:
             return list(self.node_list)
 
+    def connect_all(self, max_concurrency=8, timeout=300):
+        """
+        Connect to all the nodes of the cluster in parallel. Nodes which are
+        already connected are skipped.
+
+        Args:
+            max_concurrency (int): maximum number of nodes connecting at the
+                same time, should stay below sshd MaxStartups (10 by default)
+            timeout (int): keepalive timeout passed to CephNode.connect
+
+        """
+        nodes = [node for node in self.node_list if not node.is_connected]
+        if not nodes:
+            return
+        logger.info(f"Connecting {len(nodes)} nodes of cluster {self.name}")
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            futures = [executor.submit(node.connect, timeout) for node in nodes]
+            for future in futures:
+                future.result()
+
     def get_ceph_objects(self, role=None):
         """
         Get Ceph Object by role. Returns all objects if role is not defined. Ceph object can be Ceph demon, client,
@@ -81,10 +189,11 @@ class Ceph(object):
             list: ceph objects
 
         """
-        node_list = self.get_nodes(role)
+        if role:
+            return list(self._get_objects_by_role().get(role, ()))
         ceph_object_list = []
-        for node in node_list:
-            ceph_object_list.extend(node.get_ceph_objects(role))
+        for node in self.node_list:
+            ceph_object_list.extend(node.ceph_object_list)
         return ceph_object_list
 
     def get_ceph_object(self, role, order_id=0):
@@ -114,11 +223,11 @@ class Ceph(object):
             list: list of CephDemon
 
         """
-        node_list = self.get_nodes(role)
-        ceph_demon_list = []
-        for node in node_list:  # type: CephNode
-            ceph_demon_list.extend(node.get_ceph_demons(role))
-        return ceph_demon_list
+        return [
+            ceph_demon
+            for ceph_demon in self.get_ceph_objects(role)
+            if isinstance(ceph_demon, CephDemon) and ceph_demon.is_active
+        ]
 
     @property
     def ceph_demon_stat(self):
@@ -342,16 +451,27 @@ class RolesContainer(object):
     """
 
     def __init__(self, role="pool"):
+        # Dict is used as an ordered set: O(1) dedup keeping insertion order
         if isinstance(role, str):
-            self.role_list = [str(role)]
+            self._roles = {str(role): None}
         else:
-            self.role_list = role if len(role) > 0 else ["pool"]
+            self._roles = dict.fromkeys(role if len(role) > 0 else ["pool"])
+
+    @property
+    def role_list(self):
+        return list(self._roles)
+
+    @role_list.setter
+    def role_list(self, roles):
+        self._roles = dict.fromkeys(roles)
 
     def __eq__(self, role):
         if isinstance(role, str):
-            return role in self.role_list
+            return role in self._roles
+        elif isinstance(role, RolesContainer):
+            return self._roles.keys() <= role._roles.keys()
         else:
-            return all(atomic_role in role for atomic_role in self.role_list)
+            return self._roles.keys() <= frozenset(role)
 
     def __ne__(self, role):
         return not self.__eq__(role)
@@ -363,37 +483,45 @@ class RolesContainer(object):
             return False
 
     def __len__(self):
-        return len(self.role_list)
+        return len(self._roles)
 
     def __getitem__(self, key):
         return self.role_list[key]
 
     def __setitem__(self, key, value):
-        self.role_list[key] = value
+        role_list = self.role_list
+        role_list[key] = value
+        self.role_list = role_list
 
     def __delitem__(self, key):
-        del self.role_list[key]
+        role_list = self.role_list
+        del role_list[key]
+        self.role_list = role_list
 
     def __iter__(self):
-        return iter(self.role_list)
+        return iter(self._roles)
+
+    def __contains__(self, role):
+        return role in self._roles
 
     def remove(self, object):
-        self.role_list.remove(object)
+        if object not in self._roles:
+            raise ValueError(f"{object} not in role list")
+        del self._roles[object]
 
     def append(self, object):
-        self.role_list.append(object)
+        self._roles[object] = None
 
     def extend(self, iterable):
-        self.role_list.extend(iterable)
-        self.role_list = list(set(self.role_list))
+        for role in iterable:
+            self._roles[role] = None
 
     def update_role(self, roles_list):
-        if "pool" in self.role_list:
-            self.role_list.remove("pool")
+        self._roles.pop("pool", None)
         self.extend(roles_list)
 
     def clear(self):
-        self.role_list = ["pool"]
+        self._roles = {"pool": None}
 
 
 class NodeVolume(object):
@@ -404,7 +532,54 @@ class NodeVolume(object):
         self.status = status
 
 
+class ShellCommandStatus(object):
+    """
+    Exit status of a command run on the persistent shell, exposing the part
+    of the paramiko.Channel API used on the output of exec_command
+
+    """
+
+    def __init__(self, exit_status):
+        self.exit_status = exit_status
+
+    def exit_status_ready(self):
+        return True
+
+    def recv_exit_status(self):
+        return self.exit_status
+
+
+class ShellCommandOutput(io.BytesIO):
+    """
+    Output of a command run on the persistent shell. Behaves like the
+    paramiko.ChannelFile returned by exec_command: read() returns bytes,
+    reading lines returns str and the exit status is available through
+    the channel attribute.
+
+    """
+
+    def __init__(self, data, channel):
+        super(ShellCommandOutput, self).__init__(data)
+        self.channel = channel
+
+    def readline(self, size=-1):
+        return super(ShellCommandOutput, self).readline(size).decode()
+
+    def readlines(self, hint=-1):
+        return [
+            line.decode() for line in super(ShellCommandOutput, self).readlines(hint)
+        ]
+
+    def __next__(self):
+        return super(ShellCommandOutput, self).__next__().decode()
+
+
 class SSHConnectionManager(object):
+    # Process-wide pool of connection managers keyed on (ip_address, username)
+    # and the constructor arguments
+    _pool = {}
+    _pool_lock = threading.Lock()
+
     def __init__(
         self, ip_address, username, password, look_for_keys=False, outage_timeout=300
     ):
@@ -415,20 +590,64 @@ class SSHConnectionManager(object):
         self._client = paramiko.SSHClient()
         self._client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
         self._transport = None
+        # Serializes (re)connecting of the client shared by all the users
+        self._lock = threading.Lock()
+        self._keepalive = 0
         self._outage_start_time = None
         self.outage_timeout = datetime.timedelta(seconds=outage_timeout)
 
+    @classmethod
+    def get(cls, ip_address, username, password, **kwargs):
+        """
+        Get connection manager for the given host and user from the pool,
+        creating a new one only if none is cached yet. This allows all the
+        callers to share a single authenticated transport per (host, user).
+        Managers created with different additional arguments are not shared.
+
+        Args:
+            ip_address (str): host to connect to
+            username (str): login user
+            password (str): login password
+            **kwargs: additional arguments passed to the constructor
+
+        Returns:
+            SSHConnectionManager: pooled connection manager
+
+        """
+        key = (ip_address, username, tuple(sorted(kwargs.items())))
+        with cls._pool_lock:
+            manager = cls._pool.get(key)
+            if manager is None or manager.password != password:
+                manager = cls(ip_address, username, password, **kwargs)
+                cls._pool[key] = manager
+        return manager
+
     @property
     def client(self):
         return self.get_client()
 
     def get_client(self):
-        if not (self._transport and self._transport.is_active()):
-            self._connect()
-            self._transport = self._client.get_transport()
+        with self._lock:
+            if not (self._transport and self._transport.is_active()):
+                self._connect()
+                self._transport = self._client.get_transport()
+                if self._keepalive:
+                    self._transport.set_keepalive(self._keepalive)
 
         return self._client
 
+    def set_keepalive(self, interval):
+        """
+        Set keepalive interval of the transport. The interval is remembered
+        and applied again whenever the connection is re-established.
+
+        Args:
+            interval (int): seconds between keepalive packets, 0 disables it
+
+        """
+        self._keepalive = interval
+        self.get_transport().set_keepalive(interval)
+
     def _connect(self):
         while True:
             try:
@@ -456,15 +675,24 @@ class SSHConnectionManager(object):
         return self.get_transport()
 
     def get_transport(self):
-        self._transport = self.client.get_transport()
+        if not (self._transport and self._transport.is_active()):
+            self._transport = self.client.get_transport()
         return self._transport
 
     def __getstate__(self):
         pickle_dict = self.__dict__.copy()
-        del pickle_dict["_SSHConnectionManager__transport"]
-        del pickle_dict["_SSHConnectionManager__client"]
+        del pickle_dict["_transport"]
+        del pickle_dict["_client"]
+        del pickle_dict["_lock"]
         return pickle_dict
 
+    def __setstate__(self, pickle_dict):
+        self.__dict__.update(pickle_dict)
+        self._client = paramiko.SSHClient()
+        self._client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+        self._transport = None
+        self._lock = threading.Lock()
+
 
 class CephNode(object):
     def __init__(self, **kw):
@@ -484,42 +712,88 @@ class CephNode(object):
         self.vmname = kw["hostname"]
         vmshortname = self.vmname.split(".")
         self.vmshortname = vmshortname[0]
-        self.volume_list = []
-        if kw.get("no_of_volumes", 3):
-            self.volume_list = [
-                NodeVolume(NodeVolume.FREE) for vol_id in range(kw["no_of_volumes"])
-            ]
+        self.cluster = None
+        self._role_cache = None
+        no_of_volumes = kw.get("no_of_volumes", 3) or 0
+        self.volume_list = [NodeVolume(NodeVolume.FREE) for _ in range(no_of_volumes)]
 
+        ceph_object_factory = CephObjectFactory(self)
         self.ceph_object_list = [
-            CephObjectFactory(self).create_ceph_object(role)
+            ceph_object_factory.create_ceph_object(role)
             for role in kw["role"]
             if role != "pool"
         ]
-        while (
-            len(self.get_ceph_objects("osd")) > 0 and len(self.get_free_volumes()) > 0
-        ):
-            self.ceph_object_list.append(
-                CephObjectFactory(self).create_ceph_object("osd")
+        # Each of the remaining free volumes of an osd node gets its own osd
+        if self.get_ceph_objects("osd"):
+            self.ceph_object_list.extend(
+                ceph_object_factory.create_ceph_object("osd")
+                for _ in range(len(self.get_free_volumes()))
             )
 
         if kw.get("ceph_vmnode"):
             self.vm_node = kw["ceph_vmnode"]
-        self.root_connection = SSHConnectionManager(
+        self.root_connection = SSHConnectionManager.get(
             self.ip_address, "root", self.root_passwd
         )
-        self.connection = SSHConnectionManager(
+        self.connection = SSHConnectionManager.get(
             self.ip_address, self.username, self.password
         )
         self.rssh = self.root_connection.get_client
         self.rssh_transport = self.root_connection.get_transport
         self.ssh = self.connection.get_client
         self.ssh_transport = self.connection.get_transport
+        self._shells = {}
+        self._shell_locks = {"root": threading.Lock(), "user": threading.Lock()}
+        self._sftp = {}
         self.run_once = False
 
     @property
     def role(self):
-        return RolesContainer(
-            [ceph_demon.role for ceph_demon in self.ceph_object_list if ceph_demon]
+        # Roles are cached as a tuple, every caller gets its own container
+        # so changing it can't make the cache disagree with ceph_object_list
+        return RolesContainer(self._get_roles())
+
+    def _get_roles(self):
+        """
+        Get roles of the ceph objects of the node, computed on first use
+
+        Returns:
+            tuple: roles (str) of the node
+
+        """
+        if self._role_cache is None:
+            self._role_cache = tuple(
+                RolesContainer(
+                    [
+                        ceph_demon.role
+                        for ceph_demon in self.ceph_object_list
+                        if ceph_demon
+                    ]
+                )
+            )
+        return self._role_cache
+
+    def _invalidate_role(self):
+        """
+        Drop cached roles of the node and the role index of its cluster
+
+        """
+        self._role_cache = None
+        if self.cluster:
+            self.cluster.invalidate_role_index()
+
+    @property
+    def is_connected(self):
+        """
+        Whether the node was set up by connect and both its transports are alive
+
+        Returns:
+            bool: True if the node is connected
+
+        """
+        return self.run_once and all(
+            connection._transport and connection._transport.is_active()
+            for connection in (self.root_connection, self.connection)
         )
 
     def get_free_volumes(self):
@@ -561,29 +835,43 @@ class CephNode(object):
                 host_name=self.vmname, ip_address=self.ip_address
             )
         )
+        self._close_channels()
 
-        stdin, stdout, stderr = self.rssh().exec_command("dmesg")
-        self.rssh_transport().set_keepalive(timeout)
-        self.rssh().exec_command("echo 120 > /proc/sys/net/ipv4/tcp_keepalive_time")
-        self.rssh().exec_command("echo 60 > /proc/sys/net/ipv4/tcp_keepalive_intvl")
-        self.rssh().exec_command("echo 20 > /proc/sys/net/ipv4/tcp_keepalive_probes")
-        self.exec_command(cmd="ls / ; uptime ; date")
-        self.ssh_transport().set_keepalive(timeout)
-        out, err = self.exec_command(cmd="hostname")
+        self.rssh().exec_command(
+            "dmesg; "
+            "echo 120 > /proc/sys/net/ipv4/tcp_keepalive_time; "
+            "echo 60 > /proc/sys/net/ipv4/tcp_keepalive_intvl; "
+            "echo 20 > /proc/sys/net/ipv4/tcp_keepalive_probes"
+        )
+        self.root_connection.set_keepalive(timeout)
+        self.connection.set_keepalive(timeout)
+        # Independent probes run on parallel channels of the same transport
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [
+                executor.submit(self.exec_command, cmd="ls / ; uptime ; date"),
+                executor.submit(self.exec_command, cmd="hostname"),
+                executor.submit(self.set_internal_ip),
+                executor.submit(self.exec_command, cmd="echo 'TMOUT=600' >> ~/.bashrc"),
+                executor.submit(
+                    self.exec_command,
+                    cmd="[ -f /etc/redhat-release ] && echo rpm || echo deb",
+                ),
+            ]
+            results = [future.result() for future in futures]
+        out, _ = results[1]
         self.hostname = out.read().strip().decode()
         shortname = self.hostname.split(".")
         self.shortname = shortname[0]
         logger.info(
             "hostname and shortname set to %s and %s", self.hostname, self.shortname
         )
-        self.set_internal_ip()
-        self.exec_command(cmd="echo 'TMOUT=600' >> ~/.bashrc")
-        self.exec_command(cmd="[ -f /etc/redhat-release ]", check_ec=False)
-        if self.exit_status == 0:
-            self.pkg_type = "rpm"
-        else:
-            self.pkg_type = "deb"
+        out, _ = results[4]
+        self.pkg_type = out.read().strip().decode()
         logger.info("finished connect")
+        # Keepalive kept by the connection managers from now on, also across
+        # reconnects, so it doesn't need to be set again for every command
+        self.root_connection.set_keepalive(15)
+        self.connection.set_keepalive(15)
         self.run_once = True
 
     def set_internal_ip(self):
@@ -629,28 +917,57 @@ class CephNode(object):
         stdin = None
         stdout = None
         stderr = None
-        if self.run_once:
-            self.ssh_transport().set_keepalive(15)
-            self.rssh_transport().set_keepalive(15)
         if kw.get("long_running"):
             logger.info("long running command --")
             channel = ssh().get_transport().open_session()
             channel.exec_command(kw["cmd"])
-            read = ""
+            read = bytearray()
             while True:
-                if channel.exit_status_ready():
+                exit_status_ready = channel.exit_status_ready()
+                if not exit_status_ready:
+                    rl, wl, xl = select([channel], [], [channel], 4200)
+                if exit_status_ready or len(rl) > 0 or len(xl) > 0:
+                    # Drain everything buffered before going back to select
+                    while channel.recv_ready():
+                        data = channel.recv(65536)
+                        if not data:
+                            break
+                        read.extend(data)
+                        logger.info(data.decode(errors="replace"))
+                    # Stderr is not part of the result, but it must be read as
+                    # well, otherwise select keeps reporting the channel ready
+                    while channel.recv_stderr_ready():
+                        data = channel.recv_stderr(65536)
+                        if not data:
+                            break
+                        logger.info(data.decode(errors="replace"))
+                if exit_status_ready:
                     ec = channel.recv_exit_status()
                     break
-                rl, wl, xl = select([channel], [], [channel], 4200)
-                if len(rl) > 0:
-                    data = channel.recv(1024)
-                    read += data.decode()
-                    logger.info(data.decode())
-                if len(xl) > 0:
-                    data = channel.recv(1024)
-                    read += data.decode()
-                    logger.info(data.decode())
-            return read, ec
+            return read.decode(), ec
+        # Background commands would keep the shell output open, so they are
+        # left to the dedicated channel
+        if not kw["cmd"].rstrip().endswith("&"):
+            shell_result = self._shell_exec_command(
+                kw["cmd"], bool(kw.get("sudo")), kw.get("timeout")
+            )
+            if shell_result:
+                stdout, stderr, exit_status = shell_result
+                self.exit_status = exit_status
+                if kw.get("check_ec", True) and exit_status != 0:
+                    logger.error(
+                        "Error during cmd %s, timeout %d", exit_status, timeout
+                    )
+                    raise CommandFailed(
+                        kw["cmd"]
+                        + " Error:  "
+                        + str(stderr.read().decode())
+                        + " "
+                        + str(self.ip_address)
+                    )
+                if exit_status == 0:
+                    logger.info("Command completed successfully")
+                return stdout, stderr
         try:
             stdin, stdout, stderr = ssh().exec_command(kw["cmd"], timeout=timeout)
         except SSHException as e:
@@ -675,14 +992,204 @@ class CephNode(object):
         else:
             return stdout, stderr
 
+    def _get_shell(self, sudo, timeout=None):
+        """
+        Get the persistent shell channel of the node, opening it on first use.
+        A separate shell is kept for root and for the regular user.
+
+        Args:
+            sudo (bool): True for the root shell
+            timeout (int): timeout in seconds for the shell to start
+
+        Returns:
+            paramiko.Channel: shell channel
+
+        Raises:
+            EOFError: if the shell exited while starting
+
+        """
+        key = "root" if sudo else "user"
+        shell = self._shells.get(key)
+        if shell is None or shell.closed or shell.exit_status_ready():
+            transport = self.rssh_transport() if sudo else self.ssh_transport()
+            # Shell without pty, so there is no echo or prompt on the output
+            shell = transport.open_session()
+            shell.settimeout(timeout)
+            shell.invoke_shell()
+            # Login shell may print from its profile, that output is dropped
+            # so it doesn't end up in the output of the first command
+            sentinel = f"__OCSCI_{uuid.uuid4().hex}__"
+            try:
+                shell.sendall(f"echo {sentinel}; echo {sentinel} >&2\n".encode())
+                self._read_until_sentinel(shell.makefile("rb"), sentinel)
+                self._read_until_sentinel(shell.makefile_stderr("rb"), sentinel)
+            except Exception:
+                shell.close()
+                raise
+            self._shells[key] = shell
+        return shell
+
+    def _close_channels(self):
+        """
+        Close all the persistent shell and SFTP channels of the node
+
+        """
+        for shell in self._shells.values():
+            shell.close()
+        self._shells = {}
+        for sftp in self._sftp.values():
+            sftp.close()
+        self._sftp = {}
+
+    def _shell_exec_command(self, cmd, sudo, timeout=None):
+        """
+        Run the command on the persistent shell of the node, so short-lived
+        commands don't pay the cost of opening a new channel each time.
+        End of the output is detected by a sentinel printed on both stdout
+        and stderr after the command finishes.
+
+        Args:
+            cmd (str): command to execute
+            sudo (bool): run the command on the root shell
+            timeout (int): timeout in seconds for the command output, None
+                waits for as long as the command runs
+
+        Returns:
+            tuple: stdout (ShellCommandOutput), stderr (ShellCommandOutput)
+                and exit status, or None if the shell was not usable and
+                the command was not run
+
+        """
+        lock = self._shell_locks["root" if sudo else "user"]
+        # Shell busy with a command from another thread, let the caller use
+        # its own channel instead of waiting
+        if not lock.acquire(blocking=False):
+            return None
+        try:
+            return self._run_on_shell(cmd, sudo, timeout)
+        finally:
+            lock.release()
+
+    def _run_on_shell(self, cmd, sudo, timeout=None):
+        """
+        Run the command on the persistent shell, caller must hold the shell lock.
+        Without timeout it waits for the command for as long as it runs, like
+        recv_exit_status of a dedicated channel.
+
+        Args:
+            cmd (str): command to execute
+            sudo (bool): run the command on the root shell
+            timeout (int): timeout in seconds for the command output
+
+        Returns:
+            tuple: stdout (ShellCommandOutput), stderr (ShellCommandOutput)
+                and exit status, or None if the shell was not usable and
+                the command was not run
+
+        """
+        sentinel = f"__OCSCI_{uuid.uuid4().hex}__"
+        try:
+            shell = self._get_shell(sudo, timeout)
+            shell.settimeout(timeout)
+            # Subshell with stdin detached keeps the shell state untouched
+            # and prevents the command from consuming the following input
+            shell.sendall(
+                f"( {cmd}\n) < /dev/null; __rc=$?; echo {sentinel} >&2; "
+                f"echo {sentinel}$__rc\n".encode()
+            )
+        except (SSHException, socket.error, EOFError) as e:
+            logger.warning("Persistent shell is not usable: %s", e)
+            self._shells.pop("root" if sudo else "user", None)
+            return None
+        try:
+            stdout, exit_status = self._read_until_sentinel(
+                shell.makefile("rb"), sentinel
+            )
+            stderr, _ = self._read_until_sentinel(shell.makefile_stderr("rb"), sentinel)
+        except (SSHException, socket.error, EOFError) as e:
+            # The command was already sent, so it must not be run again
+            self._shells.pop("root" if sudo else "user", None)
+            shell.close()
+            raise CommandFailed(
+                f"{cmd} Error: failed to read command output: {e} {self.ip_address}"
+            )
+        exit_status = self._parse_exit_status(exit_status)
+        channel = ShellCommandStatus(exit_status)
+        return (
+            ShellCommandOutput(stdout, channel),
+            ShellCommandOutput(stderr, channel),
+            exit_status,
+        )
+
+    @staticmethod
+    def _parse_exit_status(status):
+        """
+        Parse exit status printed by the shell after the sentinel
+
+        Args:
+            status (str): rest of the sentinel line
+
+        Returns:
+            int: exit status of the command, -1 if it could not be parsed
+
+        """
+        try:
+            return int(status)
+        except ValueError:
+            return -1
+
+    @staticmethod
+    def _read_until_sentinel(stream, sentinel):
+        """
+        Read the stream line by line up to the sentinel
+
+        Args:
+            stream (paramiko.ChannelFile): stream to read from
+            sentinel (str): sentinel marking end of the output
+
+        Returns:
+            tuple: bytes read before the sentinel and rest of the sentinel line
+
+        Raises:
+            EOFError: if the stream was closed before the sentinel appeared
+
+        """
+        marker = sentinel.encode()
+        read = bytearray()
+        while True:
+            line = stream.readline()
+            if not line:
+                raise EOFError("Shell closed before end of the command output")
+            if marker in line:
+                head, _, tail = line.partition(marker)
+                read.extend(head)
+                return bytes(read), tail.strip().decode()
+            read.extend(line)
+
+    def _get_sftp(self, sudo):
+        """
+        Get the SFTP session of the node, opening it on first use.
+        A separate session is kept for root and for the regular user.
+
+        Args:
+            sudo (bool): True for the root session
+
+        Returns:
+            paramiko.SFTPClient: sftp client
+
+        """
+        key = "root" if sudo else "user"
+        sftp = self._sftp.get(key)
+        if sftp is None or sftp.get_channel().closed:
+            client = self.rssh if sudo else self.ssh
+            sftp = client().open_sftp()
+            self._sftp[key] = sftp
+        return sftp
+
     def write_file(self, **kw):
-        if kw.get("sudo"):
-            client = self.rssh
-        else:
-            client = self.ssh
         file_name = kw["file_name"]
         file_mode = kw["file_mode"]
-        ftp = client().open_sftp()
+        ftp = self._get_sftp(bool(kw.get("sudo")))
         remote_file = ftp.file(file_name, file_mode, -1)
         return remote_file
 
@@ -703,14 +1210,20 @@ class CephNode(object):
         del node_info["ssh_transport"]
         del node_info["root_connection"]
         del node_info["connection"]
+        del node_info["_shells"]
+        del node_info["_shell_locks"]
+        del node_info["_sftp"]
         return node_info
 
     def __setstate__(self, pickle_dict):
         self.__dict__.update(pickle_dict)
-        self.root_connection = SSHConnectionManager(
+        self._shells = {}
+        self._shell_locks = {"root": threading.Lock(), "user": threading.Lock()}
+        self._sftp = {}
+        self.root_connection = SSHConnectionManager.get(
             self.ip_address, "root", self.root_passwd
         )
-        self.connection = SSHConnectionManager(
+        self.connection = SSHConnectionManager.get(
             self.ip_address, self.username, self.password
         )
         self.rssh = self.root_connection.get_client
@@ -748,6 +1261,7 @@ class CephNode(object):
         """
         ceph_object = CephObjectFactory(self).create_ceph_object(role)
         self.ceph_object_list.append(ceph_object)
+        self._invalidate_role()
         return ceph_object
 
     def remove_ceph_object(self, ceph_object):
@@ -759,6 +1273,7 @@ class CephNode(object):
 
         """
         self.ceph_object_list.remove(ceph_object)
+        self._invalidate_role()
         if ceph_object.role == "osd":
             self.get_allocated_volumes()[0].status = NodeVolume.FREE
 
@@ -964,6 +1479,10 @@ class CephClient(CephObject):
 class CephObjectFactory(object):
     DEMON_ROLES = ["mon", "osd", "mgr", "rgw", "mds", "nfs"]
     CLIENT_ROLES = ["client"]
+    ROLE_CLASSES = {
+        **dict.fromkeys(DEMON_ROLES, CephDemon),
+        **dict.fromkeys(CLIENT_ROLES, CephClient),
+    }
 
     def __init__(self, node):
         """
@@ -986,8 +1505,8 @@ class CephObjectFactory(object):
             Ceph object based on role
 
         """
-        if role == self.CLIENT_ROLES:
-            return CephClient(role, self.node)
+        if role == "pool":
+            return None
         if role == "osd":
             free_volume_list = self.node.get_free_volumes()
             if len(free_volume_list) > 0:
@@ -995,7 +1514,4 @@ class CephObjectFactory(object):
             else:
                 raise RuntimeError("Insufficient of free volumes")
             return CephOsd(self.node)
-        if role in self.DEMON_ROLES:
-            return CephDemon(role, self.node)
-        if role != "pool":
-            return CephObject(role, self.node)
+        return self.ROLE_CLASSES.get(role, CephObject)(role, self.node)
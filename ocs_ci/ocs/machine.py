@@ -1018,6 +1018,45 @@ def get_machineset_from_machine_name(machine_name):
             )
 
 
+def get_machine_names_by_node_name():
+    """
+    Get the associated machine name of every node, using a single list of
+    the cluster machines
+
+    Returns:
+        dict: Node name as key and machine name as value
+
+    """
+    machines_obj = OCP(
+        kind="Machine", namespace=constants.OPENSHIFT_MACHINE_API_NAMESPACE
+    )
+    return {
+        machine_dict["status"]["nodeRef"]["name"]: machine_dict["metadata"]["name"]
+        for machine_dict in machines_obj.get()["items"]
+        if machine_dict.get("status", {}).get("nodeRef")
+    }
+
+
+def get_machineset_names_by_machine_name():
+    """
+    Get the associated machineset name of every machine, using a single list
+    of the cluster machines
+
+    Returns:
+        dict: Machine name as key and machineset name as value
+
+    """
+    machines_obj = OCP(
+        kind="Machine", namespace=constants.OPENSHIFT_MACHINE_API_NAMESPACE
+    )
+    return {
+        machine_dict["metadata"]["name"]: machine_dict["metadata"]
+        .get("labels", {})
+        .get("machine.openshift.io/cluster-api-machineset")
+        for machine_dict in machines_obj.get()["items"]
+    }
+
+
 def get_replica_count(machine_set):
     """
     Get replica count of a machine set
@@ -1186,6 +1186,28 @@ def get_master_nodes():
     return master_nodes_list
 
 
+def get_node_names_by_selector(selector):
+    """
+    Fetches the names of the nodes matching the label selector. Only the
+    names are requested from the API server rather than the full node objects,
+    which are large on big clusters.
+
+    Args:
+        selector (str): The label selector to look for
+
+    Returns:
+        list: List of names of the matching nodes
+
+    """
+    ocp_node_obj = ocp.OCP(kind=constants.NODE)
+    out = ocp_node_obj.exec_oc_cmd(
+        f"get {constants.NODE} --selector={selector} "
+        "-o jsonpath='{.items[*].metadata.name}'",
+        out_yaml_format=False,
+    )
+    return out.split()
+
+
 def get_worker_nodes():
     """
     Fetches all worker nodes.
@@ -1198,20 +1220,15 @@ def get_worker_nodes():
     from ocs_ci.ocs.cluster import is_hci_provider_cluster
 
     label = "node-role.kubernetes.io/worker"
-    ocp_node_obj = ocp.OCP(kind=constants.NODE)
-    nodes = ocp_node_obj.get(selector=label).get("items")
+    worker_nodes_list = get_node_names_by_selector(label)
     # Eliminate infra nodes from worker nodes in case of openshift dedicated
     if config.ENV_DATA["platform"].lower() in constants.MANAGED_SERVICE_PLATFORMS:
-        infra_nodes = ocp_node_obj.get(selector=constants.INFRA_NODE_LABEL).get("items")
-        infra_node_ids = [
-            infra_node.get("metadata").get("name") for infra_node in infra_nodes
-        ]
-        nodes = [
-            node
-            for node in nodes
-            if node.get("metadata").get("name") not in infra_node_ids
+        infra_node_ids = set(get_node_names_by_selector(constants.INFRA_NODE_LABEL))
+        worker_nodes_list = [
+            node_name
+            for node_name in worker_nodes_list
+            if node_name not in infra_node_ids
         ]
-    worker_nodes_list = [node.get("metadata").get("name") for node in nodes]
     if is_hci_provider_cluster():
         master_node_list = get_master_nodes()
         worker_nodes_list = list(set(worker_nodes_list) - set(master_node_list))
@@ -2846,16 +2863,17 @@ def generate_new_nodes_and_osd_running_nodes_ipi(
     osd_running_worker_nodes = osd_running_worker_nodes or get_osd_running_nodes()
 
     # Get the machine name using the node name
+    machine_names_by_node = machine.get_machine_names_by_node_name()
     machine_names = [
-        machine.get_machine_from_node_name(osd_running_worker_node)
+        machine_names_by_node.get(osd_running_worker_node)
         for osd_running_worker_node in osd_running_worker_nodes[:num_of_nodes]
     ]
     log.info(f"{osd_running_worker_nodes} associated " f"machine are {machine_names}")
 
     # Get the machineset name using machine name
+    machineset_names_by_machine = machine.get_machineset_names_by_machine_name()
     machineset_names = [
-        machine.get_machineset_from_machine_name(machine_name)
-        for machine_name in machine_names
+        machineset_names_by_machine.get(machine_name) for machine_name in machine_names
     ]
     log.info(
         f"{osd_running_worker_nodes[:num_of_nodes]} associated machineset is {machineset_names}"
@@ -1,7 +1,13 @@
 from abc import ABC
 import datetime
+import itertools
 import uuid
 
+# Rule IDs are made of a random per-process prefix and a running counter,
+# so creating a rule doesn't need to read random bytes from the OS
+_RULE_ID_PREFIX = uuid.uuid4().hex[:4]
+_rule_id_counter = itertools.count()
+
 
 class LifecyclePolicy:
     """
@@ -9,6 +15,8 @@ class LifecyclePolicy:
 
     """
 
+    __slots__ = ("rules",)
+
     def __init__(self, *args):
         """
         Constructor method for the class
@@ -22,9 +30,12 @@ class LifecyclePolicy:
         else:
             self.rules = args
 
-        for rule in self.rules:
-            if not isinstance(rule, LifecycleRule):
-                raise TypeError(f"Rule {rule} is not of type LifecycleRule")
+        if not all(isinstance(rule, LifecycleRule) for rule in self.rules):
+            rule = next(r for r in self.rules if not isinstance(r, LifecycleRule))
+            raise TypeError(f"Rule {rule} is not of type LifecycleRule")
+
+        if len({rule.id for rule in self.rules}) != len(self.rules):
+            raise ValueError("Lifecycle policy rules must have unique IDs")
 
     def as_dict(self):
         return {"Rules": [rule.as_dict() for rule in self.rules]}
@@ -42,6 +53,8 @@ class LifecycleFilter:
 
     """
 
+    __slots__ = ("prefix", "_tags", "minBytes", "maxBytes", "_tag_dicts")
+
     def __init__(self, prefix=None, tags=None, minBytes=None, maxBytes=None):
         """
         Constructor method for the class
@@ -61,40 +74,46 @@ class LifecycleFilter:
         self.minBytes = minBytes
         self.maxBytes = maxBytes
 
+    @property
+    def tags(self):
+        return self._tags
+
+    @tags.setter
+    def tags(self, tags):
+        self._tags = tags
+        # Convert tags from a dictionary to a list of dictionaries in expected format
+        self._tag_dicts = [
+            {"Key": key, "Value": val} for key, val in (tags or {}).items()
+        ]
+
     def as_dict(self):
-        list_of_tag_dicts = []
+        # Copy the tag dicts so callers can't modify the filter through the result
+        tag_dicts = [dict(tag_dict) for tag_dict in self._tag_dicts]
 
-        # Initially add any criteria under the "And" key
-        filter_dict = {"And": {}}
+        criteria = []
         if self.prefix:
-            filter_dict["And"]["Prefix"] = self.prefix
+            criteria.append(("Prefix", self.prefix))
         if self.minBytes:
-            filter_dict["And"]["ObjectSizeGreaterThan"] = self.minBytes
+            criteria.append(("ObjectSizeGreaterThan", self.minBytes))
         if self.maxBytes:
-            filter_dict["And"]["ObjectSizeLessThan"] = self.maxBytes
-        if self.tags:
-            # Convert tags from a dictionary to a list of dictionaries in expected format
-            for key, val in self.tags.items():
-                list_of_tag_dicts.append({"Key": key, "Value": val})
-            filter_dict["And"]["Tags"] = list_of_tag_dicts
+            criteria.append(("ObjectSizeLessThan", self.maxBytes))
 
-        # If there is no filter criteria, set an empty dict
-        if len(filter_dict["And"]) == 0:
-            filter_dict = {}
+        # If there's only one tag and no other criteria, place it as a dict
+        # under "Tag" instead of inside a list under "Tags"
+        if len(tag_dicts) == 1 and not criteria:
+            return {"Tag": tag_dicts[0]}
+        if tag_dicts:
+            criteria.append(("Tags", tag_dicts))
 
-        # If there's only one criteria and it's not tags, remove the "And" key
-        elif len(filter_dict["And"]) == 1 and len(list_of_tag_dicts) == 0:
-            key, val = next(iter(filter_dict["And"].items()))
-            filter_dict = {key: val}
+        # If there is no filter criteria, set an empty dict
+        if not criteria:
+            return {}
 
-        # If there's only one tag, remove the "And" key and place
-        # the one tag as a dict under "Tag" instead of inside a list under "Tags"
-        elif len(filter_dict["And"]) == 1 and len(list_of_tag_dicts) == 1:
-            filter_dict["And"]["Tag"] = list_of_tag_dicts[0]
-            del filter_dict["And"]["Tags"]
-            filter_dict = filter_dict["And"]
+        # If there's only one criteria and it's not tags, skip the "And" key
+        if len(criteria) == 1 and not tag_dicts:
+            return dict(criteria)
 
-        return filter_dict
+        return {"And": dict(criteria)}
 
     def __str__(self):
         return self.as_dict().__str__()
@@ -109,6 +128,8 @@ class LifecycleRule(ABC):
 
     """
 
+    __slots__ = ("filter", "is_enabled", "_id")
+
     def __init__(self, filter=LifecycleFilter(), is_enabled=True):
         """
         Constructor method for the class
@@ -120,7 +141,7 @@ class LifecycleRule(ABC):
         """
         self.filter = filter
         self.is_enabled = is_enabled
-        self._id = f"rule-{uuid.uuid4().hex[:8]}"
+        self._id = f"rule-{_RULE_ID_PREFIX}{next(_rule_id_counter):04x}"
 
     def as_dict(self):
         rule_dict = {
@@ -148,6 +169,8 @@ class ExpirationRule(LifecycleRule):
 
     """
 
+    __slots__ = ("days", "use_date", "expire_solo_delete_markers", "_creation_date")
+
     def __init__(
         self,
         days,
@@ -180,14 +203,16 @@ class ExpirationRule(LifecycleRule):
         self.days = days
         self.use_date = use_date
         self.expire_solo_delete_markers = expire_solo_delete_markers
+        # The expiration date is counted from the day the rule is created
+        self._creation_date = datetime.date.today()
 
     def as_dict(self):
         rule_dict = super().as_dict()
         if self.use_date:
             expiration_time_key = "Date"
             expiration_time_value = (
-                datetime.datetime.now() + datetime.timedelta(days=self.days)
-            ).strftime("%Y-%m-%d")
+                self._creation_date + datetime.timedelta(days=self.days)
+            ).isoformat()
         else:
             expiration_time_key = "Days"
             expiration_time_value = self.days
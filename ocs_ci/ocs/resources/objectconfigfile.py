@@ -27,6 +27,9 @@ from ocs_ci.ocs.exceptions import CommandFailed, NotFoundError
 
 logger = logging.getLogger(name=__file__)
 
+# Field manager used for server side apply of object config files
+SERVER_SIDE_FIELD_MANAGER = "ocs-ci"
+
 
 def link_spec_volume(spec_dict, volume_name, pvc_name):
     """
@@ -80,7 +83,7 @@ class ObjectConfFile:
         self.yaml_file = tmp_path / f"objectconfig.{self.name}.yaml"
         self.yaml_file.write_text(yaml.dump_all(obj_dict_list))
 
-    def _run_command(self, command, namespace, out_yaml_format=False):
+    def _run_command(self, command, namespace, out_yaml_format=False, extra_args=None):
         """
         Run given oc command on this object file.
 
@@ -88,6 +91,7 @@ class ObjectConfFile:
             command (str): Either ``create``, ``delete`` or ``get``
             namespace (str): Name of the namespace for oc command
             out_yaml_format (bool): Use oc yaml output format
+            extra_args (list): Additional arguments for the oc command
         """
         if namespace is None:
             namespace = self.project.namespace
@@ -109,6 +113,8 @@ class ObjectConfFile:
             "-n",
             namespace,
         ]
+        if extra_args:
+            oc_cmd.extend(extra_args)
         if out_yaml_format:
             oc_cmd.extend(["-o", "yaml"])
         # assuming run_cmd is logging everything
@@ -137,7 +143,7 @@ class ObjectConfFile:
         """
         return self._run_command("delete", namespace)
 
-    def apply(self, namespace=None):
+    def apply(self, namespace=None, server_side=False):
         """
         Run ``oc apply`` on in this object file.
 
@@ -145,8 +151,18 @@ class ObjectConfFile:
             namespace (str): Name of the namespace where to deploy, overriding
             self.project.namespace value (in a similar way how you can specify
             any value to ``-n`` option of ``oc apply``.
-        """
-        return self._run_command("apply", namespace)
+            server_side (bool): Let the API server merge the changes
+                (``--server-side``) instead of diffing every object on the
+                client side, conflicts with other field managers are forced
+        """
+        extra_args = None
+        if server_side:
+            extra_args = [
+                "--server-side",
+                "--force-conflicts",
+                f"--field-manager={SERVER_SIDE_FIELD_MANAGER}",
+            ]
+        return self._run_command("apply", namespace, extra_args=extra_args)
 
     def get(self, namespace=None):
         """
@@ -1,11 +1,16 @@
+import itertools
+import json
 import logging
 import threading
 import random
 import time
 import datetime
+from copy import deepcopy
 import re
 import os
 import pathlib
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
 
 from ocs_ci.helpers import helpers
 from ocs_ci.ocs.ocp import OCP
@@ -172,19 +177,25 @@ class FioPodScale(object):
         lcl[f"rbd_pvc_kube_{obj_name}"].create(namespace=self.namespace)
         lcl[f"cephfs_pvc_kube_{obj_name}"].create(namespace=self.namespace)
 
-        # Check all the PVC reached Bound state
-        rbd_pvc_name = check_all_pvc_reached_bound_state_in_kube_job(
-            kube_job_obj=lcl[f"rbd_pvc_kube_{obj_name}"],
-            namespace=self.namespace,
-            no_of_pvc=int(pvc_count / 2),
-            timeout=60,
-        )
-        fs_pvc_name = check_all_pvc_reached_bound_state_in_kube_job(
-            kube_job_obj=lcl[f"cephfs_pvc_kube_{obj_name}"],
-            namespace=self.namespace,
-            no_of_pvc=int(pvc_count / 2),
-            timeout=60,
-        )
+        # Check all the PVC reached Bound state, both kube jobs are
+        # provisioned at the same time so wait for them in parallel
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            rbd_pvc_future = executor.submit(
+                check_all_pvc_reached_bound_state_in_kube_job,
+                kube_job_obj=lcl[f"rbd_pvc_kube_{obj_name}"],
+                namespace=self.namespace,
+                no_of_pvc=int(pvc_count / 2),
+                timeout=60,
+            )
+            fs_pvc_future = executor.submit(
+                check_all_pvc_reached_bound_state_in_kube_job,
+                kube_job_obj=lcl[f"cephfs_pvc_kube_{obj_name}"],
+                namespace=self.namespace,
+                no_of_pvc=int(pvc_count / 2),
+                timeout=60,
+            )
+            rbd_pvc_name = rbd_pvc_future.result()
+            fs_pvc_name = fs_pvc_future.result()
 
         # Construct pod yaml file for kube_job
         pod_data_list = list()
@@ -220,12 +231,25 @@ class FioPodScale(object):
         )
         lcl[f"pod_kube_{obj_name}"].create(namespace=self.namespace)
 
+        # Wait for the PODs on a single watch, the kube_job check below then
+        # only has to collect the names on its first pass. If the PODs are not
+        # Running within the watch timeout, which covers the first 9 kube_job
+        # wait iterations, the kube_job check continues from its 10th iteration
+        # i.e. deletes the stuck DC PODs and fails if they don't come up
+        pod_check_interval = 90
+        pods_running = wait_for_pods_running_in_namespace(
+            namespace=self.namespace,
+            pod_names=[pod_data["metadata"]["name"] for pod_data in pod_data_list],
+            timeout=9 * pod_check_interval,
+        )
+
         # Check all the POD reached Running state
         pod_running_list = check_all_pod_reached_running_state_in_kube_job(
             kube_job_obj=lcl[f"pod_kube_{obj_name}"],
             namespace=self.namespace,
             no_of_pod=len(pod_data_list),
-            timeout=90,
+            timeout=pod_check_interval,
+            skip_iterations=0 if pods_running else 9,
         )
 
         # Update list with all the kube_job object created, list will be
@@ -395,7 +419,7 @@ class FioPodScale(object):
             )
 
             # Apply PVC changes to extend PVC
-            kube_job.apply(namespace=self.namespace)
+            kube_job.apply(namespace=self.namespace, server_side=True)
 
             # Validate PVC size is extended or not
             validate_all_expanded_pvc_size_in_kube_job(
@@ -1200,6 +1224,8 @@ def construct_pvc_creation_yaml_bulk_for_kube_job(
             f"The max pvc size is {max_pvc_size}, and it should be greater than 9"
         )
     pvc_dict_list = list()
+    # Parse the template once, every PVC gets its own copy of it
+    pvc_template = templating.load_yaml(constants.CSI_PVC_YAML)
     for i in range(no_of_pvc):
         pvc_name = helpers.create_unique_resource_name("test", "pvc")
         size = (
@@ -1207,7 +1233,7 @@ def construct_pvc_creation_yaml_bulk_for_kube_job(
             if pvc_size is None
             else pvc_size
         )
-        pvc_data = templating.load_yaml(constants.CSI_PVC_YAML)
+        pvc_data = deepcopy(pvc_template)
         pvc_data["metadata"]["name"] = pvc_name
         del pvc_data["metadata"]["namespace"]
         pvc_data["spec"]["accessModes"] = [access_mode]
@@ -1240,9 +1266,10 @@ def construct_pvc_clone_yaml_bulk_for_kube_job(pvc_dict_list, clone_yaml, sc_nam
     # Construct PVC.yaml for the no_of_required_pvc count
     # append all the pvc.yaml dict to pvc_dict_list and return the list
     pvc_clone_dict_list = list()
+    clone_template = templating.load_yaml(clone_yaml)
     for pvc_yaml in pvc_dict_list:
         parent_pvc_name = pvc_yaml["metadata"]["name"]
-        clone_data_yaml = templating.load_yaml(clone_yaml)
+        clone_data_yaml = deepcopy(clone_template)
         clone_data_yaml["metadata"]["name"] = helpers.create_unique_resource_name(
             parent_pvc_name, "clone"
         )
@@ -1335,8 +1362,79 @@ def get_max_pvc_count():
     return pvc_count
 
 
+def get_dc_name_from_pod_name(pod_name):
+    """
+    Get the name of the DeploymentConfig which owns the POD
+
+    Args:
+        pod_name (str): Name of a POD, DC PODs are named <dc-name>-<version>-<suffix>
+
+    Returns:
+        str: Name of the DeploymentConfig
+
+    """
+    return pod_name.rsplit("-", 2)[0]
+
+
+def wait_for_pods_running_in_namespace(namespace, pod_names, timeout=810):
+    """
+    Function to wait for PODs to reach Running state by following a single
+    `oc get pods -w` stream of the namespace, instead of polling the kube_job.
+    For DeploymentConfig the PODs are matched to the DC by their name prefix.
+
+    Args:
+        namespace (str): Namespace of the PODs
+        pod_names (list): Names of the PODs or DeploymentConfigs to wait for
+        timeout (sec): Time to wait for all the PODs to reach Running state
+
+    Returns:
+        bool: True if all the PODs reached Running state, False otherwise
+
+    """
+    expected = set(pod_names)
+    running = set()
+    cmd = [
+        "oc",
+        "get",
+        "pods",
+        "-n",
+        namespace,
+        "-w",
+        "-o",
+        r'jsonpath={.metadata.name} {.status.phase}{"\n"}',
+    ]
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    try:
+        for line in utils.read_process_lines(proc, timeout):
+            name, _, phase = line.strip().partition(" ")
+            # The deployer POD <dc-name>-<version>-deploy is skipped
+            if name.endswith("-deploy"):
+                continue
+            owner = name if name in expected else get_dc_name_from_pod_name(name)
+            if owner not in expected:
+                continue
+            if phase == constants.STATUS_RUNNING:
+                running.add(owner)
+                if running == expected:
+                    break
+            else:
+                running.discard(owner)
+    finally:
+        proc.kill()
+        proc.wait()
+
+    if running != expected:
+        logger.warning(
+            f"{len(expected - running)} PODs not in Running state after watching "
+            f"namespace {namespace}"
+        )
+        return False
+    logger.info(f"All the {len(expected)} PODs are in Running state")
+    return True
+
+
 def check_all_pod_reached_running_state_in_kube_job(
-    kube_job_obj, namespace, no_of_pod, timeout=30
+    kube_job_obj, namespace, no_of_pod, timeout=30, skip_iterations=0
 ):
     """
     Function to check either bulk created PODs reached Running state using kube_job
@@ -1346,6 +1444,8 @@ def check_all_pod_reached_running_state_in_kube_job(
         namespace (str): Namespace of PVC's created
         no_of_pod (int): POD count
         timeout (sec): Timeout between each POD iteration check
+        skip_iterations (int): Number of wait iterations already spent waiting
+            for the PODs elsewhere, counted against the iteration limits
 
     Returns:
         pod_running_list (list): List of all PODs reached running state.
@@ -1357,7 +1457,7 @@ def check_all_pod_reached_running_state_in_kube_job(
 
     # Check all the POD reached Running state
     pod_running_list, pod_not_running_list = ([], [])
-    while_iteration_count = 0
+    while_iteration_count = skip_iterations
     dc_pod = 0
     while True:
         # Get kube_job obj and fetch either all PODs are in Running state
@@ -1466,11 +1566,12 @@ def attach_multiple_pvc_to_pod_dict(
     pods_list, temp_list = ([], [])
     if raw_block_pv:
         pod_yaml = constants.PERF_BLOCK_POD_YAML
+    # Parse the template once, every pod gets its own copy of it
+    pod_template = templating.load_yaml(pod_yaml)
     for pvc_name in pvc_list:
         temp_list.append(pvc_name)
         if len(temp_list) == pvcs_per_pod:
-            pod_dict = pod_yaml
-            pod_data = templating.load_yaml(pod_dict)
+            pod_data = deepcopy(pod_template)
             pod_name = helpers.create_unique_resource_name("scale", "pod")
 
             # Update pod yaml with required params
@@ -1645,12 +1746,20 @@ def scale_ocs_node(node_count=3):
         else:
             add_replica_by = node_count
 
-        replica = machine_utils.get_ready_replica_count(ms_name[0].name)
-
-        # Increase the replica count and wait for node add to complete.
-        for ms in ms_name:
-            machine_utils.add_node(
-                machine_set=ms.name, count=(replica + add_replica_by)
+        # Increase the replica count of all the machinesets at once and
+        # wait for node add to complete.
+        with ThreadPoolExecutor(max_workers=len(ms_name)) as executor:
+            list(
+                executor.map(
+                    lambda ms: machine_utils.add_node(
+                        machine_set=ms.name,
+                        count=(
+                            machine_utils.get_ready_replica_count(ms.name)
+                            + add_replica_by
+                        ),
+                    ),
+                    ms_name,
+                )
             )
         threads = list()
         for ms in ms_name:
@@ -1672,10 +1781,11 @@ def scale_ocs_node(node_count=3):
             return False
 
         # Label OCS worker nodes
-        node_obj = OCP(kind="node")
-        for new_node in new_spun_node:
+        if new_spun_node:
+            node_obj = OCP(kind="node")
             node_obj.add_label(
-                resource_name=new_node, label=constants.OPERATOR_NODE_LABEL
+                resource_name=" ".join(new_spun_node),
+                label=constants.OPERATOR_NODE_LABEL,
             )
             logger.info(f"Successfully labeled {new_spun_node} with OCS storage label")
         return True
@@ -1735,13 +1845,16 @@ def validate_all_pvcs_and_check_state(namespace, pvc_scale_list):
     """
 
     all_pvc_dict = get_all_pvcs(namespace=namespace)
+    expected_pvcs = set(pvc_scale_list)
     pvc_bound_list, pvc_not_bound_list = ([], [])
-    for i in range(len(pvc_scale_list)):
-        pvc_data = all_pvc_dict["items"][i]
+    for pvc_data in all_pvc_dict["items"]:
+        pvc_name = pvc_data["metadata"]["name"]
+        if pvc_name not in expected_pvcs:
+            continue
         if not pvc_data["status"]["phase"] == constants.STATUS_BOUND:
-            pvc_not_bound_list.append(pvc_data["metadata"]["name"])
+            pvc_not_bound_list.append(pvc_name)
         else:
-            pvc_bound_list.append(pvc_data["metadata"]["name"])
+            pvc_bound_list.append(pvc_name)
 
     # Check status of PVCs scaled
     if not len(pvc_bound_list) == len(pvc_scale_list):
@@ -1767,15 +1880,28 @@ def validate_all_pods_and_check_state(namespace, pod_scale_list):
 
     ocp_pod_obj = OCP(kind=constants.DEPLOYMENTCONFIG, namespace=namespace)
     all_pods_dict = ocp_pod_obj.get()
+    available_replicas = {
+        dc_data["metadata"]["name"]: dc_data["status"].get("availableReplicas")
+        for dc_data in all_pods_dict["items"]
+    }
+    # The recorded names are DC names, or POD names which are mapped to
+    # the DC owning them
+    expected_dcs = set()
+    for name in pod_scale_list:
+        dc_name = get_dc_name_from_pod_name(name)
+        expected_dcs.add(
+            dc_name
+            if name not in available_replicas and dc_name in available_replicas
+            else name
+        )
     pod_running_list, pod_not_running_list = ([], [])
-    for i in range(len(pod_scale_list)):
-        pod_data = all_pods_dict["items"][i]
-        if not pod_data["status"]["availableReplicas"]:
-            pod_not_running_list.append(pod_data["metadata"]["name"])
+    for dc_name in expected_dcs:
+        if not available_replicas.get(dc_name):
+            pod_not_running_list.append(dc_name)
         else:
-            pod_running_list.append(pod_data["metadata"]["name"])
+            pod_running_list.append(dc_name)
 
-    if not len(pod_running_list) == len(pod_scale_list):
+    if not len(pod_running_list) == len(expected_dcs):
         logger.error(
             f"POD Running count mismatch {len(pod_not_running_list)} PODs not in Running state "
             f"PODs not in Running state {pod_not_running_list}"
@@ -1916,24 +2042,27 @@ def collect_scale_data_in_file(
 
     pod_count = pvc_count / pvc_per_pod_count
 
-    # Get PVCs and PODs count and list
-    pod_running_list, pvc_bound_list = ([], [])
-    for pod_objs in kube_pod_obj_list:
-        pod_running_list.extend(
-            check_all_pod_reached_running_state_in_kube_job(
+    # Get PVCs and PODs count and list, the kube jobs are checked in parallel
+    # as the checks are only waiting on the API server
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        pod_running_results = executor.map(
+            lambda pod_objs: check_all_pod_reached_running_state_in_kube_job(
                 kube_job_obj=pod_objs,
                 namespace=namespace,
                 no_of_pod=int(pod_count / len(kube_pod_obj_list)),
-            )
+            ),
+            kube_pod_obj_list,
         )
-    for pvc_objs in kube_pvc_obj_list:
-        pvc_bound_list.extend(
-            check_all_pvc_reached_bound_state_in_kube_job(
+        pvc_bound_results = executor.map(
+            lambda pvc_objs: check_all_pvc_reached_bound_state_in_kube_job(
                 kube_job_obj=pvc_objs,
                 namespace=namespace,
                 no_of_pvc=int(pvc_count / len(kube_pvc_obj_list)),
-            )
+            ),
+            kube_pvc_obj_list,
         )
+        pod_running_list = list(itertools.chain.from_iterable(pod_running_results))
+        pvc_bound_list = list(itertools.chain.from_iterable(pvc_bound_results))
 
     logger.info(
         f"Running PODs count {len(pod_running_list)} & "
@@ -1951,11 +2080,16 @@ def collect_scale_data_in_file(
             pvc_obj_file_list.append(f)
 
     # Write namespace, PVC and POD data in a SCALE_DATA_FILE which
-    # will be used during post_upgrade validation tests
-    with open(scale_data_file, "a+") as w_obj:
-        w_obj.write(str("# Scale Data File\n"))
-        w_obj.write(str(f"NAMESPACE: {namespace}\n"))
-        w_obj.write(str(f"POD_SCALE_LIST: {pod_running_list}\n"))
-        w_obj.write(str(f"PVC_SCALE_LIST: {pvc_bound_list}\n"))
-        w_obj.write(str(f"POD_OBJ_FILE_LIST: {pod_obj_file_list}\n"))
-        w_obj.write(str(f"PVC_OBJ_FILE_LIST: {pvc_obj_file_list}\n"))
+    # will be used during post_upgrade validation tests. JSON is a subset
+    # of YAML, so the file can still be read with templating.load_yaml
+    with open(scale_data_file, "w") as w_obj:
+        json.dump(
+            {
+                "NAMESPACE": namespace,
+                "POD_SCALE_LIST": pod_running_list,
+                "PVC_SCALE_LIST": pvc_bound_list,
+                "POD_OBJ_FILE_LIST": pod_obj_file_list,
+                "PVC_OBJ_FILE_LIST": pvc_obj_file_list,
+            },
+            w_obj,
+        )
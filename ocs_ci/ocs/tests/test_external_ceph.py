@@ -0,0 +1,249 @@
+import io
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import pytest
+
+from ocs_ci.ocs.external_ceph import (
+    Ceph,
+    CephNode,
+    RolesContainer,
+    SSHConnectionManager,
+    ShellCommandOutput,
+    ShellCommandStatus,
+)
+
+
+def test_roles_container_extend_dedup_keeps_order():
+    roles = RolesContainer(["mon", "osd"])
+    roles.extend(["osd", "mgr", "mon"])
+    assert roles.role_list == ["mon", "osd", "mgr"]
+    assert len(roles) == 3
+
+
+def test_roles_container_update_role_drops_pool():
+    roles = RolesContainer()
+    assert roles == "pool"
+    roles.update_role(["client"])
+    assert roles.role_list == ["client"]
+    roles.clear()
+    assert roles.role_list == ["pool"]
+
+
+def test_roles_container_eq_is_subset_check():
+    roles = RolesContainer(["mon", "osd"])
+    assert roles == "osd"
+    assert roles == ["osd", "mon", "mgr"]
+    assert roles == RolesContainer(["mgr", "osd", "mon"])
+    assert roles != ["mon"]
+    assert roles != "client"
+
+
+def test_read_until_sentinel_splits_output_and_status():
+    stream = io.BytesIO(b"line1\nline2\nlast__END__0\nnext command\n")
+    output, status = CephNode._read_until_sentinel(stream, "__END__")
+    assert output == b"line1\nline2\nlast"
+    assert status == "0"
+    assert stream.readline() == b"next command\n"
+
+
+def test_read_until_sentinel_on_own_line():
+    stream = io.BytesIO(b"err\n__END__\n")
+    assert CephNode._read_until_sentinel(stream, "__END__") == (b"err\n", "")
+
+
+def test_read_until_sentinel_closed_stream():
+    with pytest.raises(EOFError):
+        CephNode._read_until_sentinel(io.BytesIO(b"partial output"), "__END__")
+
+
+@pytest.mark.parametrize(
+    "status, expected", [("0", 0), ("2", 2), ("127", 127), ("", -1), ("x", -1)]
+)
+def test_parse_exit_status(status, expected):
+    assert CephNode._parse_exit_status(status) == expected
+
+
+def test_shell_command_output_matches_channel_file():
+    out = ShellCommandOutput(b"first\nsecond\n", ShellCommandStatus(3))
+    assert out.channel.recv_exit_status() == 3
+    assert out.readline() == "first\n"
+    assert list(out) == ["second\n"]
+    out.seek(0)
+    assert out.readlines() == ["first\n", "second\n"]
+    out.seek(0)
+    assert out.read().strip().decode() == "first\nsecond"
+
+
+def test_ssh_connection_manager_pool_key_includes_kwargs(monkeypatch):
+    monkeypatch.setattr(SSHConnectionManager, "_pool", {})
+    manager = SSHConnectionManager.get("10.0.0.1", "root", "passwd")
+    assert SSHConnectionManager.get("10.0.0.1", "root", "passwd") is manager
+    other = SSHConnectionManager.get(
+        "10.0.0.1", "root", "passwd", look_for_keys=True, outage_timeout=60
+    )
+    assert other is not manager
+    assert other.look_for_keys
+    assert other.outage_timeout.total_seconds() == 60
+
+
+def test_ssh_connection_manager_connects_once_concurrently():
+    manager = SSHConnectionManager("10.0.0.1", "root", "passwd")
+    connected = threading.Event()
+
+    def connect(*args, **kwargs):
+        time.sleep(0.1)
+        connected.set()
+
+    transport = mock.Mock()
+    transport.is_active.side_effect = connected.is_set
+    manager._client = mock.Mock()
+    manager._client.connect.side_effect = connect
+    manager._client.get_transport.return_value = transport
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        clients = list(executor.map(lambda _: manager.get_client(), range(4)))
+    assert all(client is manager._client for client in clients)
+    assert manager._client.connect.call_count == 1
+
+
+def make_node(hostname, roles):
+    return CephNode(
+        username="cephuser",
+        password="passwd",
+        ip_address=hostname,
+        hostname=hostname,
+        role=roles,
+        no_of_volumes=1,
+    )
+
+
+def test_ceph_role_index():
+    mon = make_node("mon-0", ["mon", "mgr"])
+    osd = make_node("osd-0", ["osd"])
+    cluster = Ceph(node_list=[mon, osd])
+    assert cluster.get_nodes("mon") == [mon]
+    assert cluster.get_nodes("osd") == [osd]
+    assert cluster.get_nodes("mds") == []
+    assert [obj.node for obj in cluster.get_ceph_objects("mgr")] == [mon]
+
+
+def test_ceph_role_index_node_list_changed_directly():
+    mon = make_node("mon-0", ["mon"])
+    cluster = Ceph(node_list=[mon])
+    assert cluster.get_nodes("mds") == []
+    mds = make_node("mds-0", ["mds"])
+    cluster.node_list.append(mds)
+    assert cluster.get_nodes("mds") == [mds]
+    assert [obj.node for obj in cluster.get_ceph_objects("mds")] == [mds]
+    cluster.node_list.remove(mon)
+    assert cluster.get_nodes("mon") == []
+    # Role changes of the directly added node reach the cluster too
+    mds.create_ceph_object("rgw")
+    assert cluster.get_nodes("rgw") == [mds]
+
+
+def test_ceph_role_index_setitem_delitem():
+    mon = make_node("mon-0", ["mon"])
+    osd = make_node("osd-0", ["osd"])
+    cluster = Ceph(node_list=[mon, osd])
+    assert cluster.get_nodes("osd") == [osd]
+    client = make_node("client-0", ["client"])
+    cluster[1] = client
+    assert cluster.get_nodes("osd") == []
+    assert cluster.get_nodes("client") == [client]
+    del cluster[0]
+    assert cluster.get_nodes("mon") == []
+    assert cluster.get_ceph_objects("mon") == []
+
+
+def test_ceph_role_index_create_remove_ceph_object():
+    node = make_node("node-0", ["mon"])
+    cluster = Ceph(node_list=[node])
+    assert cluster.get_nodes("mgr") == []
+    mgr = node.create_ceph_object("mgr")
+    assert cluster.get_nodes("mgr") == [node]
+    assert cluster.get_ceph_objects("mgr") == [mgr]
+    node.remove_ceph_object(mgr)
+    assert cluster.get_nodes("mgr") == []
+    assert cluster.get_ceph_objects("mgr") == []
+
+
+def test_node_role_changes_do_not_leak_into_cache():
+    node = make_node("node-0", ["mon"])
+    cluster = Ceph(node_list=[node])
+    roles = node.role
+    roles.append("nfs")
+    assert node.role.role_list == ["mon"]
+    assert node.role is not node.role
+    assert cluster.get_nodes("nfs") == []
+    assert cluster.get_ceph_objects("nfs") == []
+    assert make_node("pool-0", []).role.role_list == ["pool"]
+
+
+class FakeStream(object):
+    def __init__(self, buffer):
+        self.buffer = buffer
+
+    def readline(self):
+        end = self.buffer.find(b"\n") + 1 or len(self.buffer)
+        line = bytes(self.buffer[:end])
+        del self.buffer[:end]
+        return line
+
+
+class FakeShell(object):
+    """
+    Shell channel printing a login banner, then running commands sent by
+    CephNode._run_on_shell with a fixed output
+
+    """
+
+    closed = False
+
+    def __init__(self):
+        self.stdout = bytearray()
+        self.stderr = bytearray()
+        self.timeout = "unset"
+
+    def settimeout(self, timeout):
+        self.timeout = timeout
+
+    def exit_status_ready(self):
+        return False
+
+    def invoke_shell(self):
+        self.stdout.extend(b"Welcome from the profile\n")
+
+    def sendall(self, data):
+        data = data.decode()
+        command = re.match(r"\( (.*)\n\) < /dev/null; .*echo (\S+) >&2", data, re.S)
+        if command:
+            cmd, sentinel = command.groups()
+            self.stdout.extend(f"{cmd} output\n{sentinel}0\n".encode())
+        else:
+            sentinel = re.match(r"echo (\S+);", data).group(1)
+            self.stdout.extend(f"{sentinel}\n".encode())
+        self.stderr.extend(f"{sentinel}\n".encode())
+
+    def makefile(self, mode):
+        return FakeStream(self.stdout)
+
+    def makefile_stderr(self, mode):
+        return FakeStream(self.stderr)
+
+
+def test_shell_drops_login_output_and_honours_timeout():
+    node = make_node("node-0", ["mon"])
+    shell = FakeShell()
+    node.ssh_transport = mock.Mock(**{"return_value.open_session.return_value": shell})
+    out, err = node.exec_command(cmd="hostname")
+    assert out.read() == b"hostname output\n"
+    assert out.channel.recv_exit_status() == 0
+    assert err.read() == b""
+    assert shell.timeout is None
+    out, _ = node.exec_command(cmd="uptime", timeout=30)
+    assert out.readlines() == ["uptime output\n"]
+    assert shell.timeout == 30
@@ -0,0 +1,69 @@
+import datetime
+
+import pytest
+
+from ocs_ci.ocs.resources.mcg_lifecycle_policies import (
+    ExpirationRule,
+    LifecycleFilter,
+    LifecyclePolicy,
+)
+
+
+def test_filter_as_dict():
+    assert LifecycleFilter().as_dict() == {}
+    assert LifecycleFilter(prefix="a").as_dict() == {"Prefix": "a"}
+    assert LifecycleFilter(tags={"k": "v"}).as_dict() == {
+        "Tag": {"Key": "k", "Value": "v"}
+    }
+    assert LifecycleFilter(prefix="a", tags={"k": "v", "l": "w"}).as_dict() == {
+        "And": {
+            "Prefix": "a",
+            "Tags": [{"Key": "k", "Value": "v"}, {"Key": "l", "Value": "w"}],
+        }
+    }
+
+
+def test_expiration_rule_as_dict():
+    rule = ExpirationRule(
+        days=3, filter=LifecycleFilter(prefix="a"), expire_solo_delete_markers=True
+    )
+    assert rule.as_dict() == {
+        "Filter": {"Prefix": "a"},
+        "ID": rule.id,
+        "Status": "Enabled",
+        "Expiration": {"Days": 3, "ExpiredObjectDeleteMarker": True},
+    }
+    assert LifecyclePolicy(rule).as_dict() == {"Rules": [rule.as_dict()]}
+
+
+def test_expiration_rule_with_date():
+    rule = ExpirationRule(days=1, use_date=True, is_enabled=False)
+    rule_dict = rule.as_dict()
+    assert rule_dict["Status"] == "Disabled"
+    assert rule_dict["Expiration"] == {
+        "Date": (datetime.date.today() + datetime.timedelta(days=1)).isoformat()
+    }
+
+
+def test_rule_ids_are_unique():
+    rules = [ExpirationRule(days=1) for _ in range(100)]
+    assert len({rule.id for rule in rules}) == len(rules)
+
+
+def test_policy_rejects_invalid_rules():
+    rule = ExpirationRule(days=1)
+    with pytest.raises(TypeError):
+        LifecyclePolicy(rule, {"Days": 1})
+    with pytest.raises(ValueError):
+        LifecyclePolicy([rule, rule])
+
+
+def test_rule_changes_are_serialized():
+    rule = ExpirationRule(days=1, filter=LifecycleFilter(tags={"k": "v"}))
+    policy = LifecyclePolicy(rule)
+    policy.as_dict()["Rules"][0]["Filter"]["Tag"]["Key"] = "modified"
+    policy.rules[0].is_enabled = False
+    rule.filter.tags = {"l": "w"}
+    rule_dict = policy.as_dict()["Rules"][0]
+    assert rule_dict["Status"] == "Disabled"
+    assert rule_dict["Filter"] == {"Tag": {"Key": "l", "Value": "w"}}
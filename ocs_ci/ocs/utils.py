@@ -646,8 +646,7 @@ def create_nodes(conf, inventory, osp_cred, run_id, instances_name=None):
     log.info("Sleeping 15 Seconds")
     time.sleep(15)
     for cluster_name, cluster in ceph_cluster_dict.items():
-        for instance in cluster:
-            instance.connect()
+        cluster.connect_all()
     return ceph_cluster_dict, clients
 
 
@@ -1,3 +1,4 @@
+import functools
 import json
 import logging
 from jinja2 import Environment, FileSystemLoader, Template
@@ -5,6 +6,15 @@ import yaml
 
 from copy import deepcopy
 
+# Prefer the libyaml based loader/dumper, fall back to pure python ones.
+# SafeDumper is not used here, it is provided for the modules dumping YAML.
+try:
+    from yaml import CSafeLoader as SafeLoader
+    from yaml import CSafeDumper as SafeDumper  # noqa: F401
+except ImportError:
+    from yaml import SafeLoader
+    from yaml import SafeDumper  # noqa: F401
+
 from ocs_ci.ocs.constants import TEMPLATE_DIR
 from ocs_ci.utility.utils import censor_values, get_url_content
 
@@ -51,6 +61,27 @@ def to_nice_yaml(a, indent=2, *args, **kw):
     return transformed
 
 
+@functools.lru_cache(maxsize=None)
+def _get_jinja_environment(base_path):
+    """
+    Get jinja2 environment for the given base path. The environment is shared
+    by all the Templating instances, so the compiled templates are cached
+    across render calls.
+
+    Args:
+        base_path (str): path from which should read the jinja2 templates
+
+    Returns:
+        jinja2.Environment: environment with to_nice_yaml filter registered
+
+    """
+    j2_env = Environment(
+        loader=FileSystemLoader(base_path), trim_blocks=True, cache_size=-1
+    )
+    j2_env.filters["to_nice_yaml"] = to_nice_yaml
+    return j2_env
+
+
 class Templating:
     """
     Class which provides all functionality for templating
@@ -78,8 +109,7 @@ class Templating:
         Returns: rendered template
 
         """
-        j2_env = Environment(loader=FileSystemLoader(self._base_path), trim_blocks=True)
-        j2_env.filters["to_nice_yaml"] = to_nice_yaml
+        j2_env = _get_jinja_environment(self._base_path)
         j2_template = j2_env.get_template(template_path)
         return j2_template.render(**data)
 
@@ -151,12 +181,12 @@ def load_yaml(file, multi_document=False):
             iteration returns dict from one loaded document from a file.
 
     """
-    loader = yaml.safe_load_all if multi_document else yaml.safe_load
+    load = yaml.load_all if multi_document else yaml.load
     if file.startswith("http"):
-        return loader(get_url_content(file))
+        return load(get_url_content(file), Loader=SafeLoader)
     else:
         with open(file, "r") as fs:
-            return loader(fs.read())
+            return load(fs.read(), Loader=SafeLoader)
 
 
 def get_n_document_from_yaml(yaml_generator, index=0):
@@ -1,12 +1,16 @@
 # -*- coding: utf8 -*-
 
+import itertools
 import logging
+import os
+import time
 from itertools import repeat
 from sys import platform
+from types import SimpleNamespace
 
 import pytest
 
-from ocs_ci.ocs.exceptions import CommandFailed
+from ocs_ci.ocs.exceptions import CephHealthException, CommandFailed
 from ocs_ci.utility import utils, version
 
 
@@ -196,3 +200,74 @@ class B:
 )
 def test_filter_unrepresentable_values(data_to_filter, expected_output):
     assert utils.filter_unrepresentable_values(data_to_filter) == expected_output
+
+
+class FakeWatchProcess:
+    """
+    Process whose stdout is a pipe which stays open after the given output
+    was written, like a watch command which keeps running
+    """
+
+    def __init__(self, output):
+        read_fd, self._write_fd = os.pipe()
+        self.stdout = os.fdopen(read_fd, "rb")
+        os.write(self._write_fd, output)
+
+    def kill(self):
+        os.close(self._write_fd)
+
+    def wait(self):
+        self.stdout.close()
+
+
+def test_read_process_lines_burst():
+    """
+    Checking that all the lines written in a single burst are read without
+    waiting for more output.
+    """
+    proc = FakeWatchProcess(b"first\nsecond\nthird\npartial")
+    start = time.time()
+    lines = list(itertools.islice(utils.read_process_lines(proc, timeout=10), 3))
+    assert lines == ["first", "second", "third"]
+    assert time.time() - start < 5
+    proc.kill()
+    proc.wait()
+
+    # The last line is returned once the process closes its output
+    proc = FakeWatchProcess(b"first\nlast")
+    proc.kill()
+    assert list(utils.read_process_lines(proc, timeout=10)) == ["first", "last"]
+    proc.wait()
+
+
+def test_ceph_health_watch_burst(monkeypatch):
+    """
+    Checking that ceph_health_watch notices the cluster is healthy when the
+    message comes in the middle of a burst of the cluster log.
+    """
+    from ocs_ci.ocs.resources import pod
+
+    health = iter([CephHealthException("HEALTH_WARN"), True])
+
+    def fake_health_check(namespace):
+        result = next(health)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    output = (
+        b"  cluster:\n    health: HEALTH_WARN\n"
+        b"2024-01-01 mon.a [INF] Health check cleared: OSD_DOWN\n"
+        b"2024-01-01 mon.a [INF] Cluster is now healthy\n"
+        b"2024-01-01 mon.a [INF] pgmap v100\n"
+    )
+    monkeypatch.setattr(utils, "ceph_health_check_base", fake_health_check)
+    monkeypatch.setattr(
+        pod, "get_ceph_tools_pod", lambda namespace: SimpleNamespace(name="tools")
+    )
+    monkeypatch.setattr(
+        utils.subprocess, "Popen", lambda *args, **kwargs: FakeWatchProcess(output)
+    )
+    start = time.time()
+    assert utils.ceph_health_watch(namespace="openshift-storage", timeout=60)
+    assert time.time() - start < 5
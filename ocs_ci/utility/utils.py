@@ -7,6 +7,7 @@ import os
 import platform
 import random
 import re
+import selectors
 import shlex
 import smtplib
 import socket
@@ -2444,6 +2445,97 @@ def run_ceph_health_cmd(namespace):
     )
 
 
+def read_process_lines(proc, timeout):
+    """
+    Yield the lines the process writes to its stdout, until the process closes
+    it or the timeout expires. The pipe is read without buffering, so every
+    line of a burst is yielded as soon as it is available.
+
+    Args:
+        proc (subprocess.Popen): Process started with stdout=subprocess.PIPE
+        timeout (int): Time in seconds to read the output for
+
+    Yields:
+        str: The output lines without the trailing newline
+
+    """
+    end_time = time.time() + timeout
+    fd = proc.stdout.fileno()
+    pending = b""
+    with selectors.DefaultSelector() as sel:
+        sel.register(fd, selectors.EVENT_READ)
+        while True:
+            remaining = end_time - time.time()
+            if remaining <= 0 or not sel.select(timeout=remaining):
+                return
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                if pending:
+                    yield pending.decode(errors="replace")
+                return
+            *lines, pending = (pending + chunk).split(b"\n")
+            for line in lines:
+                yield line.decode(errors="replace")
+
+
+def ceph_health_watch(namespace=None, timeout=900):
+    """
+    Wait for the ceph cluster to become healthy by following the cluster log
+    with `ceph -w` on the tools pod, instead of polling `ceph health`. The
+    health is confirmed with `ceph health` once the cluster log reports that
+    the cluster is healthy.
+
+    Args:
+        namespace (str): Namespace of OCS
+            (default: config.ENV_DATA['cluster_namespace'])
+        timeout (int): Time in seconds to wait for HEALTH_OK
+
+    Raises:
+        CephHealthException: If the cluster didn't reach HEALTH_OK in time
+        CommandFailed: If the rook-ceph-tools pod is not available
+
+    Returns:
+        bool: True if HEALTH_OK
+
+    """
+    # Import here to avoid circular loop
+    from ocs_ci.ocs.resources.pod import get_ceph_tools_pod
+
+    namespace = namespace or config.ENV_DATA["cluster_namespace"]
+    end_time = time.time() + timeout
+    health_errors = (CephHealthException, CommandFailed, subprocess.TimeoutExpired)
+    try:
+        return ceph_health_check_base(namespace)
+    except health_errors as ex:
+        log.info(f"{ex}. Watching the cluster log for up to {timeout} seconds")
+
+    try:
+        ct_pod = get_ceph_tools_pod(namespace=namespace)
+    except (AssertionError, CephToolBoxNotFoundException) as ex:
+        raise CommandFailed(ex)
+
+    watch_cmd = f"oc -n {namespace} exec {ct_pod.name} -- ceph -w"
+    proc = subprocess.Popen(
+        shlex.split(watch_cmd), stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+    )
+    try:
+        for line in read_process_lines(proc, max(0, end_time - time.time())):
+            if "HEALTH_OK" in line or "Cluster is now healthy" in line:
+                try:
+                    return ceph_health_check_base(namespace)
+                except health_errors:
+                    continue
+        # The watch ended or timed out, poll for the rest of the time
+    finally:
+        proc.kill()
+        proc.wait()
+
+    remaining_tries = int(max(0, end_time - time.time()) / 30)
+    if remaining_tries:
+        return ceph_health_check(namespace=namespace, tries=remaining_tries, delay=30)
+    return ceph_health_check_base(namespace)
+
+
 def ceph_health_multi_storagecluster_external_base():
     """
     Check ceph health for multi-storagecluster external implementation.
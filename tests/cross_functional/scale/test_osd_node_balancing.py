@@ -3,6 +3,7 @@ Test osd node balancing by adding nodes and osds and checking their distribution
 """
 import logging
 import pytest
+from collections import Counter
 from uuid import uuid4
 from ocs_ci.framework import config
 from ocs_ci.framework.pytest_customization.marks import (
@@ -36,6 +37,27 @@ MAX_TIMES_ADDED = 3
 
 logger = logging.getLogger(__name__)
 
+# Last listed osd pods, refreshed only after the cluster layout changed
+_osd_cache = {"items": None}
+
+
+def _list_osds(force=False):
+    """
+    Get the osd pods of the cluster
+
+    Args:
+        force (bool): List the pods again even if a cached list exists
+
+    Returns:
+        list: osd pod dicts
+    """
+    if force or _osd_cache["items"] is None:
+        pod_obj = ocp.OCP(
+            kind=constants.POD, namespace=config.ENV_DATA["cluster_namespace"]
+        )
+        _osd_cache["items"] = pod_obj.get(selector=constants.OSD_APP_LABEL)["items"]
+    return _osd_cache["items"]
+
 
 def is_balanced(this_skew, maxov):
     """
@@ -60,7 +82,7 @@ def is_balanced(this_skew, maxov):
     return balanced
 
 
-def collect_stats(action_text, elastic_info):
+def collect_stats(action_text, elastic_info, refresh=True):
     """
     Write the current configuration information into the REPORT file.
     This information includes the osd, nodes and which osds are on which
@@ -71,38 +93,32 @@ def collect_stats(action_text, elastic_info):
         action_text (str): Title of last action taken
                 (usually adding nodes or adding osds)
         elastic_info (es): ElasticData object for stat collection
+        refresh (bool): List the osds again, False reuses the osds listed by
+            the previous call when the layout didn't change since then
 
     Raises:
         AssertionError: OSD layout is unbalanced
     """
     output_info = {"title": action_text}
-    pod_obj = ocp.OCP(
-        kind=constants.POD, namespace=config.ENV_DATA["cluster_namespace"]
-    )
-    osd_list = pod_obj.get(selector=constants.OSD_APP_LABEL)["items"]
-    node_stats = {}
+    osd_list = _list_osds(force=refresh)
+    # Single pass over the osds collects both the pairings and the per node
+    # counts
+    pairings = {}
+    node_counts = Counter()
     for osd_ent in osd_list:
         osd_node = osd_ent["spec"]["nodeName"]
-        if osd_node in node_stats:
-            node_stats[osd_node].append(osd_ent)
-        else:
-            node_stats[osd_node] = [osd_ent]
-    osds_per_node = []
-    for entry in node_stats:
-        osds_per_node.append(len(node_stats[entry]))
+        pairings[osd_ent["metadata"]["name"]] = osd_node
+        node_counts[osd_node] += 1
     wnodes = get_nodes(constants.WORKER_MACHINE)
-    for wnode in wnodes:
-        if wnode.name not in node_stats:
-            osds_per_node.append(0)
+    osds_per_node = list(node_counts.values())
+    osds_per_node.extend(0 for wnode in wnodes if wnode.name not in node_counts)
     maxov = max(osds_per_node)
     minov = min(osds_per_node)
     this_skew = maxov - minov
     logger.info(f"Skew found is {this_skew}")
     output_info["osds"] = osd_list
     output_info["worker_nodes"] = wnodes
-    output_info["pairings"] = {}
-    for entry in osd_list:
-        output_info["pairings"][entry["metadata"]["name"]] = entry["spec"]["nodeName"]
+    output_info["pairings"] = pairings
     output_info["maxov"] = maxov
     output_info["minov"] = minov
     output_info["skew_value"] = this_skew
@@ -127,13 +143,16 @@ class ElasticData(PerfResult):
 
     def log_recent_activity(self):
         new_data = self.results[self.record_counter]
-        logger.info(new_data["title"])
-        logger.info("pairings:")
-        for entry in new_data["pairings"]:
-            logger.info(f"     {entry} -- {new_data['pairings'][entry]}")
-        logger.info(f"maxov: {new_data['maxov']}")
-        logger.info(f"minov: {new_data['minov']}")
-        logger.info(f"skew_value: {new_data['skew_value']}")
+        # Whole record is emitted as one log message instead of a message
+        # per osd
+        lines = [new_data["title"], "pairings:"]
+        lines.extend(
+            f"     {osd} -- {node}" for osd, node in new_data["pairings"].items()
+        )
+        lines.append(f"maxov: {new_data['maxov']}")
+        lines.append(f"minov: {new_data['minov']}")
+        lines.append(f"skew_value: {new_data['skew_value']}")
+        logger.info("\n".join(lines))
 
 
 @orange_squad
@@ -183,4 +202,5 @@ class Test_Osd_Balance(PASTest):
             logger.info(f"Adding {cntval} osds to nodes")
             scale_capacity_with_deviceset(add_deviceset_count=osd_incr, timeout=900)
             collect_stats("OSD capacity increase", self.elastic_info)
-        collect_stats(FINAL_REPORT, self.elastic_info)
+        # Nothing changed since the last collected stats
+        collect_stats(FINAL_REPORT, self.elastic_info, refresh=False)
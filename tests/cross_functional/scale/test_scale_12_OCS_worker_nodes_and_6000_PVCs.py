@@ -38,6 +38,24 @@ logger = logging.getLogger(__name__)
 log_path = ocsci_log_path()
 SCALE_DATA_FILE = f"{log_path}/scale_data_file.yaml"
 
+# Ceph daemons are re-spun one at a time to keep mon quorum and data
+# availability and affect ceph health, the CSI plugin pods are independent,
+# are deleted together and don't affect ceph health
+CEPH_DAEMON_RESOURCES = ("mgr", "mon", "osd", "mds")
+
+
+@pytest.fixture(scope="class")
+def scale_data():
+    """
+    Info written to SCALE_DATA_FILE by test_scale_pvcs_pods, loaded once
+    and shared by the tests validating the scaled cluster
+    """
+    # Get info from SCALE_DATA_FILE for validation
+    if os.path.exists(SCALE_DATA_FILE):
+        return templating.load_yaml(SCALE_DATA_FILE)
+    else:
+        raise FileNotFoundError(f"Scale data file {SCALE_DATA_FILE} not found")
+
 
 @orange_squad
 @scale_changed_layout
@@ -153,29 +171,27 @@ class TestAddNode(E2ETest):
             pytest.param(*["rbdplugin"], marks=[pytest.mark.polarion_id("OCS-1891")]),
         ],
     )
-    def test_respin_ceph_pods(self, resource_to_delete):
+    def test_respin_ceph_pods(self, resource_to_delete, scale_data):
         """
         Test re-spin of Ceph daemond pods, Operator and CSI Pods
         in Scaled cluster
         """
 
-        # Get info from SCALE_DATA_FILE for validation
-        if os.path.exists(SCALE_DATA_FILE):
-            file_data = templating.load_yaml(SCALE_DATA_FILE)
-            namespace = file_data.get("NAMESPACE")
-            pod_scale_list = file_data.get("POD_SCALE_LIST")
-            pvc_scale_list = file_data.get("PVC_SCALE_LIST")
-        else:
-            raise FileNotFoundError
+        namespace = scale_data.get("NAMESPACE")
+        pod_scale_list = scale_data.get("POD_SCALE_LIST")
+        pvc_scale_list = scale_data.get("PVC_SCALE_LIST")
 
         # perform disruption test
         disruption = disruption_helpers.Disruptions()
         disruption.set_resource(resource=resource_to_delete)
         no_of_resource = disruption.resource_count
-        for i in range(0, no_of_resource):
-            disruption.delete_resource(resource_id=i)
-
-        utils.ceph_health_check()
+        if resource_to_delete in CEPH_DAEMON_RESOURCES:
+            for i in range(0, no_of_resource):
+                disruption.delete_resource(resource_id=i)
+            utils.ceph_health_watch()
+        else:
+            # delete_all waits for the plugin pods to be Running again
+            disruption.delete_all()
 
         # Validate all PVCs from namespace are in Bound state
         assert scale_lib.validate_all_pvcs_and_check_state(
@@ -203,19 +219,14 @@ class TestAddNode(E2ETest):
             ),
         ],
     )
-    def test_rolling_reboot_node(self, node_type):
+    def test_rolling_reboot_node(self, node_type, scale_data):
         """
         Test to rolling reboot of nodes
         """
 
-        # Get info from SCALE_DATA_FILE for validation
-        if os.path.exists(SCALE_DATA_FILE):
-            file_data = templating.load_yaml(SCALE_DATA_FILE)
-            namespace = file_data.get("NAMESPACE")
-            pod_scale_list = file_data.get("POD_SCALE_LIST")
-            pvc_scale_list = file_data.get("PVC_SCALE_LIST")
-        else:
-            raise FileNotFoundError
+        namespace = scale_data.get("NAMESPACE")
+        pod_scale_list = scale_data.get("POD_SCALE_LIST")
+        pvc_scale_list = scale_data.get("PVC_SCALE_LIST")
 
         node_list = list()
 
@@ -255,19 +266,14 @@ class TestAddNode(E2ETest):
         )
 
     @ignore_leftovers
-    def test_add_node_cleanup(self):
+    def test_add_node_cleanup(self, scale_data):
         """
         Test to cleanup possible resources created in TestAddNode class
         """
 
-        # Get info from SCALE_DATA_FILE for validation
-        if os.path.exists(SCALE_DATA_FILE):
-            file_data = templating.load_yaml(SCALE_DATA_FILE)
-            namespace = file_data.get("NAMESPACE")
-            pod_obj_file_list = file_data.get("POD_OBJ_FILE_LIST")
-            pvc_obj_file_list = file_data.get("PVC_OBJ_FILE_LIST")
-        else:
-            raise FileNotFoundError
+        namespace = scale_data.get("NAMESPACE")
+        pod_obj_file_list = scale_data.get("POD_OBJ_FILE_LIST")
+        pvc_obj_file_list = scale_data.get("PVC_OBJ_FILE_LIST")
 
         ocs_obj = OCP(namespace=namespace)
 
@@ -1,6 +1,9 @@
+import itertools
+import json
 import logging
 import pytest
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 from ocs_ci.ocs.ocp import OCP
 from ocs_ci.ocs import constants, scale_lib
@@ -53,24 +56,27 @@ def test_scale_pvcs_pods_pre_upgrade():
     namespace = fioscale.namespace
     scale_round_up_count = SCALE_COUNT + 20
 
-    # Get PVCs and PODs count and list
-    pod_running_list, pvc_bound_list = ([], [])
-    for pod_objs in kube_pod_obj_list:
-        pod_running_list.extend(
-            scale_lib.check_all_pod_reached_running_state_in_kube_job(
+    # Get PVCs and PODs count and list, the kube jobs are checked in parallel
+    # as the checks are only waiting on the API server
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        pod_running_results = executor.map(
+            lambda pod_objs: scale_lib.check_all_pod_reached_running_state_in_kube_job(
                 kube_job_obj=pod_objs,
                 namespace=namespace,
                 no_of_pod=int(scale_round_up_count / 40),
-            )
+            ),
+            kube_pod_obj_list,
         )
-    for pvc_objs in kube_pvc_obj_list:
-        pvc_bound_list.extend(
-            scale_lib.check_all_pvc_reached_bound_state_in_kube_job(
+        pvc_bound_results = executor.map(
+            lambda pvc_objs: scale_lib.check_all_pvc_reached_bound_state_in_kube_job(
                 kube_job_obj=pvc_objs,
                 namespace=namespace,
                 no_of_pvc=int(scale_round_up_count / 4),
-            )
+            ),
+            kube_pvc_obj_list,
         )
+        pod_running_list = list(itertools.chain.from_iterable(pod_running_results))
+        pvc_bound_list = list(itertools.chain.from_iterable(pvc_bound_results))
 
     log.info(
         f"Running PODs count {len(pod_running_list)} & "
@@ -80,11 +86,15 @@ def test_scale_pvcs_pods_pre_upgrade():
 
     # Write namespace, PVC and POD data in a SCALE_DATA_FILE which
     # will be used during post_upgrade validation tests
-    with open(SCALE_DATA_FILE, "a+") as w_obj:
-        w_obj.write(str("# Scale Data File\n"))
-        w_obj.write(str(f"NAMESPACE: {namespace}\n"))
-        w_obj.write(str(f"POD_SCALE_LIST: {pod_running_list}\n"))
-        w_obj.write(str(f"PVC_SCALE_LIST: {pvc_bound_list}\n"))
+    with open(SCALE_DATA_FILE, "w") as w_obj:
+        json.dump(
+            {
+                "NAMESPACE": namespace,
+                "POD_SCALE_LIST": pod_running_list,
+                "PVC_SCALE_LIST": pvc_bound_list,
+            },
+            w_obj,
+        )
 
     # Check ceph health status
     utils.ceph_health_check(tries=30)
@@ -433,8 +433,9 @@ class TestNodesMaintenance(ManageTest):
 
         # Save the machine count of the worker nodes and the machine names of the osd nodes
         machine_count = len(machine.get_machines())
+        machine_names_by_node = machine.get_machine_names_by_node_name()
         machine_names_of_osd_nodes = [
-            machine.get_machine_from_node_name(n) for n in osd_running_worker_nodes
+            machine_names_by_node.get(n) for n in osd_running_worker_nodes
         ]
         # Remove unscheduled nodes
         # In scenarios where the drain is attempted on >3 worker setup,